@@ -1,14 +1,21 @@
 import streamlit as st
+import html
 import json
+import pandas as pd
 from typing import Dict, List, Any
 import io
+import shutil
 import sys
+import tempfile
+import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.rag_engine import RAGEngine, JobApplicationSession
-from src.database import db_manager
+from src.rag_engine import get_rag_engine, JobApplicationSession
+from src.database import get_db_manager, DATABASE_URL
 
 st.set_page_config(
     page_title="SmartHire - AI Job Application Assistant",
@@ -18,7 +25,22 @@ st.set_page_config(
 
 @st.cache_resource
 def initialize_rag_engine():
-    return RAGEngine("data/jobs.json")
+    return get_rag_engine("data/jobs.json")
+
+@st.cache_resource
+def _executor():
+    # SQLite allows a single writer, so extra workers would just queue up
+    # on the database lock
+    workers = 1 if DATABASE_URL.startswith("sqlite") else 4
+    return ThreadPoolExecutor(max_workers=workers)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_stats():
+    return get_db_manager().get_application_stats()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_recent(limit: int):
+    return get_db_manager().get_all_applications(limit=limit)
 
 def initialize_session_state():
     if 'rag_engine' not in st.session_state:
@@ -38,6 +60,12 @@ def initialize_session_state():
     
     if 'screening_answers' not in st.session_state:
         st.session_state.screening_answers = []
+
+    if 'screening_questions' not in st.session_state:
+        st.session_state.screening_questions = []
+
+    if 'selected_job_title' not in st.session_state:
+        st.session_state.selected_job_title = ""
     
     if 'current_question_index' not in st.session_state:
         st.session_state.current_question_index = 0
@@ -50,38 +78,81 @@ def initialize_session_state():
     
     if 'search_results' not in st.session_state:
         st.session_state.search_results = []
+
+    if 'last_search_key' not in st.session_state:
+        st.session_state.last_search_key = None
     
     if 'resume_data' not in st.session_state:
         st.session_state.resume_data = {}
 
+    if 'submit_future' not in st.session_state:
+        st.session_state.submit_future = None
+
+def _job_card_html(job):
+    match_bar = ""
+    if hasattr(job, 'match_score'):
+        score_percentage = int(job.match_score * 100)
+        match_bar = (
+            f'<div style="background:#e6e6e6;border-radius:4px;height:8px;max-width:240px;margin-top:6px;">'
+            f'<div style="background:#ff4b4b;border-radius:4px;height:8px;width:{score_percentage}%;"></div></div>'
+            f'<small>Match: {score_percentage}%</small>'
+        )
+
+    description = job.description[:500] + "..." if len(job.description) > 500 else job.description
+
+    return f"""
+<div style="border:1px solid #ddd;border-radius:8px;padding:12px 16px;">
+    <b>{html.escape(job.title)}</b><br>
+    <i>{html.escape(job.company)}</i> | 📍 {html.escape(job.location)} | 👨‍💻 {html.escape(job.experience_required)}<br>
+    💰 {html.escape(job.salary_range)}
+    {match_bar}
+    <details>
+        <summary>View Details - {html.escape(job.job_id)}</summary>
+        <b>Required Skills:</b> {html.escape(', '.join(job.skills_required))}<br>
+        <b>Description:</b> {html.escape(description)}
+    </details>
+</div>
+"""
+
 def display_job_card(job):
-    with st.container():
-        col1, col2, col3 = st.columns([3, 2, 1])
-        
-        with col1:
-            st.markdown(f"**{job.title}**")
-            st.markdown(f"*{job.company}* | 📍 {job.location}")
-            st.markdown(f"👨‍💻 {job.experience_required}")
-        
-        with col2:
-            st.markdown(f"💰 {job.salary_range}")
-            if hasattr(job, 'match_score'):
-                score_percentage = int(job.match_score * 100)
-                st.progress(score_percentage / 100)
-                st.caption(f"Match: {score_percentage}%")
-        
-        with col3:
-            if st.button(f"Apply", key=f"apply_{job.job_id}"):
-                st.session_state.selected_job = job.job_id
-                st.session_state.application_state = 'applying'
-                st.session_state.search_results = []  # Clear search results
-                st.rerun()
-        
-        with st.expander(f"View Details - {job.job_id}"):
-            st.markdown("**Required Skills:**")
-            st.write(", ".join(job.skills_required))
-            st.markdown("**Description:**")
-            st.write(job.description[:500] + "..." if len(job.description) > 500 else job.description)
+    # One HTML block per card; only the Apply button stays a real widget
+    col1, col2 = st.columns([5, 1])
+
+    with col1:
+        st.markdown(_job_card_html(job), unsafe_allow_html=True)
+
+    with col2:
+        if st.button(f"Apply", key=f"apply_{job.job_id}"):
+            st.session_state.selected_job = job.job_id
+            st.session_state.application_state = 'applying'
+            st.session_state.search_results = []  # Clear search results
+            st.session_state.last_search_key = None
+            st.rerun()
+
+def display_results_table(jobs):
+    # One Arrow dataframe render instead of a widget tree per job
+    df = pd.DataFrame([
+        {
+            "Job ID": job.job_id,
+            "Title": job.title,
+            "Company": job.company,
+            "Location": job.location,
+            "Salary": job.salary_range,
+            "Experience": job.experience_required,
+            "Match": getattr(job, 'match_score', 0.0)
+        }
+        for job in jobs
+    ])
+
+    st.dataframe(
+        df,
+        column_config={
+            "Match": st.column_config.ProgressColumn("Match", min_value=0.0, max_value=1.0, format="%.2f")
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption("Switch to card view to apply for a job.")
 
 def handle_job_search():
     st.title("🔍 Find Your Dream Job")
@@ -121,29 +192,38 @@ def handle_job_search():
         )
     
     if search_button and search_query:
-        with st.spinner("Searching for matching jobs..."):
-            filters = {}
-            if location_filter != "All Locations":
-                filters['location'] = location_filter
-            if min_salary > 0:
-                filters['min_salary'] = min_salary
-            if experience_filter != "All Levels":
-                filters['experience'] = experience_filter
-            
-            st.session_state.search_results = st.session_state.rag_engine.search_jobs(
-                search_query,
-                k=10,
-                filters=filters
-            )
+        # Skip the vector search entirely if nothing about the query changed
+        search_key = (search_query, location_filter, min_salary, experience_filter)
+
+        if st.session_state.last_search_key != search_key:
+            with st.spinner("Searching for matching jobs..."):
+                filters = {}
+                if location_filter != "All Locations":
+                    filters['location'] = location_filter
+                if min_salary > 0:
+                    filters['min_salary'] = min_salary
+                if experience_filter != "All Levels":
+                    filters['experience'] = experience_filter
+
+                st.session_state.search_results = st.session_state.rag_engine.search_jobs(
+                    search_query,
+                    k=10,
+                    filters=filters
+                )
+                st.session_state.last_search_key = search_key
     
     # Display search results if they exist
     if st.session_state.search_results:
         st.success(f"Found {len(st.session_state.search_results)} matching jobs!")
+        view_mode = st.radio("View as", ["Cards", "Table"], horizontal=True, key="results_view")
         st.markdown("---")
-        
-        for job in st.session_state.search_results:
-            display_job_card(job)
-            st.markdown("---")
+
+        if view_mode == "Table":
+            display_results_table(st.session_state.search_results)
+        else:
+            for job in st.session_state.search_results:
+                display_job_card(job)
+                st.markdown("---")
     
     elif search_button and search_query:
         st.info("No jobs found matching your criteria. Try adjusting your search terms.")
@@ -154,11 +234,13 @@ def handle_job_search():
         with col1:
             if st.button("🤖 Show me ML/AI roles"):
                 st.session_state.search_results = st.session_state.rag_engine.search_jobs("machine learning AI", k=5)
+                st.session_state.last_search_key = None
                 st.rerun()
-        
+
         with col2:
             if st.button("🏠 Remote positions"):
                 st.session_state.search_results = st.session_state.rag_engine.search_jobs("remote work from home", k=5)
+                st.session_state.last_search_key = None
                 st.rerun()
 
 def handle_application():
@@ -204,114 +286,139 @@ def handle_application():
                 }
                 
                 if uploaded_file:
+                    # Stream to a temp file; session_state keeps only the path
+                    # so megabytes of resume bytes aren't pickled on every rerun
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp:
+                        shutil.copyfileobj(uploaded_file, tmp)
+                        tmp_path = tmp.name
+
                     st.session_state.resume_data = {
                         "file_name": uploaded_file.name,
-                        "file_content": uploaded_file.read(),
+                        "file_path": tmp_path,
                         "file_type": uploaded_file.type
                     }
                     st.session_state.resume_uploaded = True
                 
+                # Cache once so every rerun of the screening page skips the job lookup
+                st.session_state.screening_questions = job.get('screening_questions', [])
+                st.session_state.selected_job_title = job['title']
+
                 st.session_state.application_state = 'screening'
                 st.rerun()
 
 def handle_screening_questions():
-    job = st.session_state.rag_engine.get_job_by_id(st.session_state.selected_job)
-    
-    if not job:
-        st.error("Job not found!")
-        return
-    
-    questions = job.get('screening_questions', [])
-    
+    questions = st.session_state.screening_questions
+
     if not questions:
         submit_application()
         return
-    
+
     st.title("📋 Screening Questions")
-    st.info(f"Please answer {len(questions)} questions for the {job['title']} position")
-    
-    progress = (st.session_state.current_question_index / len(questions))
-    st.progress(progress)
-    st.caption(f"Question {st.session_state.current_question_index + 1} of {len(questions)}")
-    
-    if st.session_state.current_question_index < len(questions):
-        current_q = questions[st.session_state.current_question_index]
-        
-        st.markdown(f"### {current_q['question']}")
-        
-        answer = None
-        
-        if current_q['type'] == 'text':
-            answer = st.text_area(
-                "Your answer:",
-                height=150,
-                placeholder="Type your detailed answer here..."
-            )
-        
-        elif current_q['type'] == 'yes_no':
-            answer = st.radio(
-                "Select your answer:",
-                ["Yes", "No"]
-            )
-        
-        elif current_q['type'] == 'multiple_choice':
-            answer = st.radio(
-                "Select your answer:",
-                current_q.get('options', [])
-            )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.session_state.current_question_index > 0:
-                if st.button("← Previous", use_container_width=True):
-                    st.session_state.current_question_index -= 1
-                    st.rerun()
-        
-        with col2:
-            if st.session_state.current_question_index < len(questions) - 1:
-                if st.button("Next →", type="primary", use_container_width=True):
-                    if answer:
-                        st.session_state.screening_answers.append({
-                            "question": current_q['question'],
-                            "answer": answer,
-                            "type": current_q['type']
-                        })
-                        st.session_state.current_question_index += 1
-                        st.rerun()
-                    else:
-                        st.error("Please provide an answer before proceeding.")
+    st.info(f"Please answer {len(questions)} questions for the {st.session_state.selected_job_title} position")
+
+    # One form for all questions: a single rerun on submit instead of one per answer
+    with st.form("all_screening"):
+        answers = []
+        for i, question in enumerate(questions):
+            st.markdown(f"### {i + 1}. {question['question']}")
+
+            if question['type'] == 'text':
+                answer = st.text_area(
+                    "Your answer:",
+                    height=150,
+                    placeholder="Type your detailed answer here...",
+                    key=f"q_{i}"
+                )
+            elif question['type'] == 'yes_no':
+                answer = st.radio(
+                    "Select your answer:",
+                    ["Yes", "No"],
+                    key=f"q_{i}"
+                )
+            elif question['type'] == 'multiple_choice':
+                answer = st.radio(
+                    "Select your answer:",
+                    question.get('options', []),
+                    key=f"q_{i}"
+                )
             else:
-                if st.button("Submit Application", type="primary", use_container_width=True):
-                    if answer:
-                        st.session_state.screening_answers.append({
-                            "question": current_q['question'],
-                            "answer": answer,
-                            "type": current_q['type']
-                        })
-                        submit_application()
-                    else:
-                        st.error("Please provide an answer before submitting.")
+                answer = st.text_input("Your answer:", key=f"q_{i}")
+
+            answers.append(answer)
+
+        submitted = st.form_submit_button("Submit Application", type="primary", use_container_width=True)
+
+    if submitted:
+        unanswered = [str(i + 1) for i, answer in enumerate(answers) if not answer]
+
+        if unanswered:
+            st.error(f"Please answer question(s) {', '.join(unanswered)} before submitting.")
+            return
+
+        st.session_state.screening_answers = [
+            {
+                "question": question['question'],
+                "answer": answer,
+                "type": question['type']
+            }
+            for question, answer in zip(questions, answers)
+        ]
+        submit_application()
 
 def submit_application():
     job = st.session_state.rag_engine.get_job_by_id(st.session_state.selected_job)
-    
-    try:
-        application_id = db_manager.create_application(
-            job_id=st.session_state.selected_job,
-            job_title=job['title'],
-            company=job['company'],
-            candidate_info=st.session_state.candidate_info,
-            screening_answers=st.session_state.screening_answers,
-            resume_data=st.session_state.resume_data if st.session_state.resume_uploaded else None
-        )
-        
-        st.session_state.application_state = 'completed'
-        st.session_state.application_id = application_id
+
+    # Hand the DB insert to a background worker and rerun immediately;
+    # handle_submitting polls the future so the browser never blocks on the write
+    st.session_state.submit_future = _executor().submit(
+        get_db_manager().create_application,
+        job_id=st.session_state.selected_job,
+        job_title=job['title'],
+        company=job['company'],
+        candidate_info=st.session_state.candidate_info,
+        screening_answers=st.session_state.screening_answers,
+        resume_data=st.session_state.resume_data if st.session_state.resume_uploaded else None
+    )
+    st.session_state.application_state = 'submitting'
+    st.rerun()
+
+def handle_submitting():
+    future = st.session_state.submit_future
+
+    if future is None:
+        st.session_state.application_state = 'searching'
         st.rerun()
-        
+        return
+
+    if not future.done():
+        with st.spinner("Submitting your application..."):
+            time.sleep(0.2)
+        st.rerun()
+        return
+
+    try:
+        application_id = future.result()
     except Exception as e:
         st.error(f"Error submitting application: {str(e)}")
+        if st.button("Back to Job Search"):
+            reset_application_state()
+            st.rerun()
+        return
+
+    tmp_path = st.session_state.resume_data.get("file_path")
+    if tmp_path:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    _cached_stats.clear()
+    _cached_recent.clear()
+
+    st.session_state.submit_future = None
+    st.session_state.application_state = 'completed'
+    st.session_state.application_id = application_id
+    st.rerun()
 
 def handle_completion():
     st.balloons()
@@ -335,17 +442,27 @@ def reset_application_state():
     st.session_state.selected_job = None
     st.session_state.candidate_info = {}
     st.session_state.screening_answers = []
+    st.session_state.screening_questions = []
+    st.session_state.selected_job_title = ""
     st.session_state.current_question_index = 0
     st.session_state.application_state = 'searching'
     st.session_state.resume_uploaded = False
     st.session_state.search_results = []
+    st.session_state.last_search_key = None
+    tmp_path = st.session_state.resume_data.get("file_path")
+    if tmp_path:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
     st.session_state.resume_data = {}
+    st.session_state.submit_future = None
     st.session_state.app_session.reset()
 
 def admin_dashboard():
     st.title("📊 Admin Dashboard")
     
-    stats = db_manager.get_application_stats()
+    stats = _cached_stats()
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -360,7 +477,7 @@ def admin_dashboard():
     st.markdown("---")
     
     st.subheader("Recent Applications")
-    applications = db_manager.get_all_applications(limit=10)
+    applications = _cached_recent(limit=10)
     
     if applications:
         for app in applications:
@@ -376,7 +493,7 @@ def admin_dashboard():
                     st.text(app['status'].upper())
                 with col4:
                     if st.button("View", key=f"view_{app['id']}"):
-                        st.write(db_manager.get_application(app['id']))
+                        st.write(get_db_manager().get_application(app['id']))
                 st.markdown("---")
     else:
         st.info("No applications yet.")
@@ -402,6 +519,8 @@ def main():
             handle_application()
         elif st.session_state.application_state == 'screening':
             handle_screening_questions()
+        elif st.session_state.application_state == 'submitting':
+            handle_submitting()
         elif st.session_state.application_state == 'completed':
             handle_completion()
     
@@ -0,0 +1,98 @@
+import hashlib
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///applications.db")
+RESUME_STORAGE_DIR = os.getenv("RESUME_STORAGE_DIR", "resume_store")
+
+NEW_COLUMNS = [
+    ("storage_path", "VARCHAR(500)"),
+    ("size_bytes", "INTEGER"),
+    ("content_sha256", "VARCHAR(64)"),
+]
+
+def _rebuild_resumes_table(conn):
+    # SQLite < 3.35 has no DROP COLUMN; rebuild the table without the blob
+    conn.execute(text(
+        "CREATE TABLE resumes_new ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "application_id INTEGER NOT NULL REFERENCES applications (id), "
+        "file_name VARCHAR(255) NOT NULL, "
+        "storage_path VARCHAR(500) NOT NULL, "
+        "size_bytes INTEGER, "
+        "content_sha256 VARCHAR(64), "
+        "file_type VARCHAR(50), "
+        "uploaded_at DATETIME NOT NULL DEFAULT (CURRENT_TIMESTAMP))"
+    ))
+    conn.execute(text(
+        "INSERT INTO resumes_new (id, application_id, file_name, storage_path, "
+        "size_bytes, content_sha256, file_type, uploaded_at) "
+        "SELECT id, application_id, file_name, storage_path, "
+        "size_bytes, content_sha256, file_type, uploaded_at FROM resumes"
+    ))
+    conn.execute(text("DROP TABLE resumes"))
+    conn.execute(text("ALTER TABLE resumes_new RENAME TO resumes"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_content_sha256 ON resumes (content_sha256)"))
+
+def _migrate_applications(conn):
+    columns = {row[1] for row in conn.execute(text("PRAGMA table_info(applications)"))}
+
+    if "screening_responses_json" not in columns:
+        conn.execute(text("ALTER TABLE applications ADD COLUMN screening_responses_json JSON"))
+
+    # Rows written before the ORM regained a client-side default may have
+    # a NULL timestamp, which breaks isoformat() on read
+    conn.execute(text(
+        "UPDATE applications SET submitted_at = CURRENT_TIMESTAMP WHERE submitted_at IS NULL"
+    ))
+
+def migrate():
+    engine = create_engine(DATABASE_URL)
+
+    with engine.connect() as conn:
+        _migrate_applications(conn)
+        conn.commit()
+
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(resumes)"))}
+
+        if "file_content" not in columns:
+            print("Nothing to migrate: resumes.file_content column not found")
+            return
+
+        for name, ddl_type in NEW_COLUMNS:
+            if name not in columns:
+                conn.execute(text(f"ALTER TABLE resumes ADD COLUMN {name} {ddl_type}"))
+
+        rows = conn.execute(text(
+            "SELECT id, file_name, file_content FROM resumes WHERE file_content IS NOT NULL"
+        )).fetchall()
+
+        for resume_id, file_name, blob in rows:
+            sha = hashlib.sha256(blob).hexdigest()
+            suffix = Path(file_name).suffix.lower() or ".pdf"
+            path = Path(RESUME_STORAGE_DIR) / sha[:2] / f"{sha}{suffix}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(blob)
+
+            conn.execute(
+                text("UPDATE resumes SET storage_path=:p, size_bytes=:s, content_sha256=:h WHERE id=:i"),
+                {"p": str(path), "s": len(blob), "h": sha, "i": resume_id}
+            )
+
+        # The old column was NOT NULL, so it must go entirely or every
+        # post-migration insert (which no longer sets it) would fail
+        try:
+            conn.execute(text("ALTER TABLE resumes DROP COLUMN file_content"))
+        except Exception:
+            _rebuild_resumes_table(conn)
+        conn.commit()
+
+    print(f"Migrated {len(rows)} resume(s) to {RESUME_STORAGE_DIR}/")
+
+if __name__ == "__main__":
+    migrate()
@@ -1,16 +1,31 @@
+import hashlib
 import os
+import shutil
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Optional, Any
 import json
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, ForeignKey, LargeBinary
+from sqlalchemy import create_engine, event, bindparam, func, or_, select, text, Column, Integer, String, Text, DateTime, ForeignKey, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship, selectinload, Session
 from dotenv import load_dotenv
 
+try:
+    import zstandard as zstd
+    # Reused across calls so the compression context is allocated once
+    _CCTX = zstd.ZstdCompressor(level=3)
+    _DCTX = zstd.ZstdDecompressor()
+except ImportError:
+    _CCTX = None
+    _DCTX = None
+
 load_dotenv()
 
 Base = declarative_base()
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///applications.db")
+RESUME_STORAGE_DIR = os.getenv("RESUME_STORAGE_DIR", "resume_store")
 
 class Application(Base):
     __tablename__ = "applications"
@@ -23,8 +38,13 @@ class Application(Base):
     candidate_email = Column(String(200), nullable=False)
     candidate_phone = Column(String(20))
     candidate_location = Column(String(200))
-    status = Column(String(50), default="submitted")
-    submitted_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(String(50), default="submitted", index=True)
+    # default backstops databases created before server_default existed in
+    # the DDL; create_all never retrofits column defaults
+    submitted_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False, index=True)
+    # Responses are only ever read back whole, so they live inline as JSON;
+    # the screening_responses table remains for rows written before this column
+    screening_responses_json = Column(JSON, default=list)
     
     screening_responses = relationship("ScreeningResponse", back_populates="application", cascade="all, delete-orphan")
     resume = relationship("Resume", back_populates="application", uselist=False, cascade="all, delete-orphan")
@@ -46,21 +66,152 @@ class Resume(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     application_id = Column(Integer, ForeignKey("applications.id"), nullable=False)
     file_name = Column(String(255), nullable=False)
-    file_content = Column(LargeBinary, nullable=False)
+    storage_path = Column(String(500), nullable=False)
+    size_bytes = Column(Integer)
+    content_sha256 = Column(String(64), index=True)
     file_type = Column(String(50))
-    uploaded_at = Column(DateTime, default=datetime.utcnow)
+    uploaded_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
     
     application = relationship("Application", back_populates="resume")
 
+# Built once at import; the LIKE fallback search reuses the compiled
+# statement with only the bound term changing per call
+_SEARCH_STMT = (
+    select(Application)
+    .where(or_(
+        Application.candidate_name.contains(bindparam("q")),
+        Application.candidate_email.contains(bindparam("q")),
+        Application.job_title.contains(bindparam("q")),
+        Application.company.contains(bindparam("q"))
+    ))
+    .limit(50)
+)
+
 class DatabaseManager:
     def __init__(self):
-        self.engine = create_engine(DATABASE_URL, echo=False)
+        is_sqlite = DATABASE_URL.startswith("sqlite")
+        self.engine = create_engine(
+            DATABASE_URL,
+            echo=False,
+            pool_size=20,
+            max_overflow=40,
+            pool_pre_ping=True,
+            connect_args={"check_same_thread": False} if is_sqlite else {},
+            future=True
+        )
+
+        if is_sqlite:
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                cursor.close()
+
         Base.metadata.create_all(self.engine)
-        self.SessionLocal = sessionmaker(bind=self.engine)
-    
+        self.SessionLocal = scoped_session(sessionmaker(bind=self.engine, expire_on_commit=False))
+        self._fts_enabled = self._init_fts() if is_sqlite else False
+
+    def _init_fts(self) -> bool:
+        try:
+            with self.engine.begin() as conn:
+                fts_existed = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='applications_fts'"
+                ).fetchone() is not None
+                conn.exec_driver_sql(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5("
+                    "candidate_name, candidate_email, job_title, company, "
+                    "content='applications', content_rowid='id')"
+                )
+                conn.exec_driver_sql(
+                    "CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN "
+                    "INSERT INTO applications_fts(rowid, candidate_name, candidate_email, job_title, company) "
+                    "VALUES (new.id, new.candidate_name, new.candidate_email, new.job_title, new.company); END"
+                )
+                conn.exec_driver_sql(
+                    "CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN "
+                    "INSERT INTO applications_fts(applications_fts, rowid, candidate_name, candidate_email, job_title, company) "
+                    "VALUES ('delete', old.id, old.candidate_name, old.candidate_email, old.job_title, old.company); END"
+                )
+                conn.exec_driver_sql(
+                    "CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE ON applications BEGIN "
+                    "INSERT INTO applications_fts(applications_fts, rowid, candidate_name, candidate_email, job_title, company) "
+                    "VALUES ('delete', old.id, old.candidate_name, old.candidate_email, old.job_title, old.company); "
+                    "INSERT INTO applications_fts(rowid, candidate_name, candidate_email, job_title, company) "
+                    "VALUES (new.id, new.candidate_name, new.candidate_email, new.job_title, new.company); END"
+                )
+                # Backfill rows that predate the triggers, but only on first
+                # creation: a full rebuild per boot would re-tokenize the
+                # whole table every start
+                if not fts_existed:
+                    conn.exec_driver_sql(
+                        "INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')"
+                    )
+            return True
+        except Exception:
+            # FTS5 not compiled into this SQLite build; fall back to LIKE search
+            return False
+
     def get_session(self) -> Session:
         return self.SessionLocal()
-    
+
+    def _store_resume_file(self, file_content: bytes, file_name: str) -> tuple:
+        sha = hashlib.sha256(file_content).hexdigest()
+        path = self._resume_store_path(sha, file_name)
+
+        # Content-addressed: identical bytes are already on disk, skip the write
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            if _CCTX is not None:
+                tmp_path.write_bytes(_CCTX.compress(file_content))
+            else:
+                tmp_path.write_bytes(file_content)
+            tmp_path.replace(path)
+
+        return str(path), len(file_content), sha
+
+    def _resume_store_path(self, sha: str, file_name: str) -> Path:
+        suffix = Path(file_name).suffix.lower() or ".pdf"
+        if _CCTX is not None:
+            suffix += ".zst"
+        return Path(RESUME_STORAGE_DIR) / sha[:2] / f"{sha}{suffix}"
+
+    def _store_resume_from_path(self, src_path: str, file_name: str) -> tuple:
+        digest = hashlib.sha256()
+        size_bytes = 0
+        with open(src_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+                size_bytes += len(chunk)
+        sha = digest.hexdigest()
+        path = self._resume_store_path(sha, file_name)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            if _CCTX is not None:
+                with open(src_path, "rb") as src, open(tmp_path, "wb") as dst:
+                    _CCTX.copy_stream(src, dst)
+            else:
+                shutil.copyfile(src_path, tmp_path)
+            tmp_path.replace(path)
+
+        return str(path), size_bytes, sha
+
+    @contextmanager
+    def _session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.SessionLocal.remove()
+
     def create_application(
         self,
         job_id: str,
@@ -71,8 +222,7 @@ class DatabaseManager:
         resume_data: Dict[str, Any] = None
     ) -> int:
         
-        session = self.get_session()
-        try:
+        with self._session() as session:
             application = Application(
                 job_id=job_id,
                 job_title=job_title,
@@ -81,75 +231,100 @@ class DatabaseManager:
                 candidate_email=candidate_info.get("email", ""),
                 candidate_phone=candidate_info.get("phone", ""),
                 candidate_location=candidate_info.get("location", ""),
-                status="submitted"
+                status="submitted",
+                screening_responses_json=[
+                    {
+                        "question": answer_data.get("question", ""),
+                        "answer": answer_data.get("answer", ""),
+                        "type": answer_data.get("type", "text")
+                    }
+                    for answer_data in screening_answers or []
+                ]
             )
             session.add(application)
             session.flush()
-            
-            if screening_answers:
-                for answer_data in screening_answers:
-                    response = ScreeningResponse(
-                        application_id=application.id,
-                        question=answer_data.get("question", ""),
-                        answer=answer_data.get("answer", ""),
-                        question_type=answer_data.get("type", "text")
-                    )
-                    session.add(response)
-            
+
             if resume_data:
+                file_name = resume_data.get("file_name", "resume.pdf")
+                if resume_data.get("file_path"):
+                    storage_path, size_bytes, sha = self._store_resume_from_path(
+                        resume_data["file_path"], file_name
+                    )
+                else:
+                    storage_path, size_bytes, sha = self._store_resume_file(
+                        resume_data.get("file_content", b""), file_name
+                    )
                 resume = Resume(
                     application_id=application.id,
-                    file_name=resume_data.get("file_name", "resume.pdf"),
-                    file_content=resume_data.get("file_content", b""),
+                    file_name=file_name,
+                    storage_path=storage_path,
+                    size_bytes=size_bytes,
+                    content_sha256=sha,
                     file_type=resume_data.get("file_type", "application/pdf")
                 )
                 session.add(resume)
-            
+
             session.commit()
             return application.id
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
     
+    def _application_to_dict(self, application: "Application") -> Dict[str, Any]:
+        return {
+            "id": application.id,
+            "job_id": application.job_id,
+            "job_title": application.job_title,
+            "company": application.company,
+            "candidate": {
+                "name": application.candidate_name,
+                "email": application.candidate_email,
+                "phone": application.candidate_phone,
+                "location": application.candidate_location
+            },
+            "status": application.status,
+            "submitted_at": application.submitted_at.isoformat(),
+            "screening_responses": application.screening_responses_json or [
+                {
+                    "question": response.question,
+                    "answer": response.answer,
+                    "type": response.question_type
+                }
+                for response in application.screening_responses
+            ],
+            "has_resume": application.resume is not None
+        }
+
     def get_application(self, application_id: int) -> Optional[Dict[str, Any]]:
-        session = self.get_session()
-        try:
-            application = session.query(Application).filter_by(id=application_id).first()
-            
+        with self._session() as session:
+            application = (
+                session.query(Application)
+                .options(
+                    selectinload(Application.screening_responses),
+                    selectinload(Application.resume)
+                )
+                .filter_by(id=application_id)
+                .first()
+            )
+
             if not application:
                 return None
-            
-            result = {
-                "id": application.id,
-                "job_id": application.job_id,
-                "job_title": application.job_title,
-                "company": application.company,
-                "candidate": {
-                    "name": application.candidate_name,
-                    "email": application.candidate_email,
-                    "phone": application.candidate_phone,
-                    "location": application.candidate_location
-                },
-                "status": application.status,
-                "submitted_at": application.submitted_at.isoformat(),
-                "screening_responses": [
-                    {
-                        "question": response.question,
-                        "answer": response.answer,
-                        "type": response.question_type
-                    }
-                    for response in application.screening_responses
-                ],
-                "has_resume": application.resume is not None
-            }
-            
-            return result
-            
-        finally:
-            session.close()
+
+            return self._application_to_dict(application)
+
+    def get_applications_bulk(self, application_ids: List[int]) -> List[Dict[str, Any]]:
+        if not application_ids:
+            return []
+
+        with self._session() as session:
+            applications = (
+                session.query(Application)
+                .options(
+                    selectinload(Application.screening_responses),
+                    selectinload(Application.resume)
+                )
+                .filter(Application.id.in_(application_ids))
+                .all()
+            )
+
+            return [self._application_to_dict(application) for application in applications]
     
     def get_all_applications(
         self, 
@@ -158,14 +333,23 @@ class DatabaseManager:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         
-        session = self.get_session()
-        try:
-            query = session.query(Application)
-            
+        with self._session() as session:
+            # Select only the columns the listing needs, not whole rows
+            query = session.query(
+                Application.id,
+                Application.job_id,
+                Application.job_title,
+                Application.company,
+                Application.candidate_name,
+                Application.candidate_email,
+                Application.status,
+                Application.submitted_at
+            )
+
             if status:
-                query = query.filter_by(status=status)
+                query = query.filter(Application.status == status)
             if job_id:
-                query = query.filter_by(job_id=job_id)
+                query = query.filter(Application.job_id == job_id)
             
             applications = query.order_by(Application.submitted_at.desc()).limit(limit).all()
             
@@ -181,29 +365,23 @@ class DatabaseManager:
                     "status": app.status,
                     "submitted_at": app.submitted_at.isoformat()
                 })
-            
+
             return results
-            
-        finally:
-            session.close()
-    
+
     def update_application_status(self, application_id: int, new_status: str) -> bool:
-        session = self.get_session()
         try:
-            application = session.query(Application).filter_by(id=application_id).first()
-            
-            if not application:
-                return False
-            
-            application.status = new_status
-            session.commit()
-            return True
-            
+            with self._session() as session:
+                application = session.query(Application).filter_by(id=application_id).first()
+
+                if not application:
+                    return False
+
+                application.status = new_status
+                session.commit()
+                return True
+
         except Exception:
-            session.rollback()
             return False
-        finally:
-            session.close()
     
     def save_resume(
         self, 
@@ -213,80 +391,90 @@ class DatabaseManager:
         file_type: str = "application/pdf"
     ) -> bool:
         
-        session = self.get_session()
         try:
-            existing_resume = session.query(Resume).filter_by(application_id=application_id).first()
-            
-            if existing_resume:
-                existing_resume.file_name = file_name
-                existing_resume.file_content = file_content
-                existing_resume.file_type = file_type
-                existing_resume.uploaded_at = datetime.utcnow()
-            else:
-                resume = Resume(
-                    application_id=application_id,
-                    file_name=file_name,
-                    file_content=file_content,
-                    file_type=file_type
-                )
-                session.add(resume)
-            
-            session.commit()
-            return True
-            
+            storage_path, size_bytes, sha = self._store_resume_file(file_content, file_name)
+
+            with self._session() as session:
+                existing_resume = session.query(Resume).filter_by(application_id=application_id).first()
+
+                if existing_resume:
+                    existing_resume.file_name = file_name
+                    existing_resume.storage_path = storage_path
+                    existing_resume.size_bytes = size_bytes
+                    existing_resume.content_sha256 = sha
+                    existing_resume.file_type = file_type
+                    existing_resume.uploaded_at = func.now()
+                else:
+                    resume = Resume(
+                        application_id=application_id,
+                        file_name=file_name,
+                        storage_path=storage_path,
+                        size_bytes=size_bytes,
+                        content_sha256=sha,
+                        file_type=file_type
+                    )
+                    session.add(resume)
+
+                session.commit()
+                return True
+
         except Exception:
-            session.rollback()
             return False
-        finally:
-            session.close()
     
     def get_resume(self, application_id: int) -> Optional[Dict[str, Any]]:
-        session = self.get_session()
-        try:
+        with self._session() as session:
             resume = session.query(Resume).filter_by(application_id=application_id).first()
-            
+
             if not resume:
                 return None
-            
+
+            file_content = Path(resume.storage_path).read_bytes()
+            if resume.storage_path.endswith(".zst"):
+                # decompressobj handles frames with or without a content-size
+                # header; copy_stream (the file_path route) writes the latter
+                file_content = _DCTX.decompressobj().decompress(file_content)
+
             return {
                 "file_name": resume.file_name,
-                "file_content": resume.file_content,
+                "file_content": file_content,
                 "file_type": resume.file_type,
                 "uploaded_at": resume.uploaded_at.isoformat()
             }
-            
-        finally:
-            session.close()
     
     def get_application_stats(self) -> Dict[str, Any]:
-        session = self.get_session()
-        try:
-            total = session.query(Application).count()
-            submitted = session.query(Application).filter_by(status="submitted").count()
-            reviewed = session.query(Application).filter_by(status="reviewed").count()
-            accepted = session.query(Application).filter_by(status="accepted").count()
-            rejected = session.query(Application).filter_by(status="rejected").count()
-            
+        with self._session() as session:
+            rows = session.execute(
+                select(Application.status, func.count()).group_by(Application.status)
+            ).all()
+            counts = dict(rows)
+
             return {
-                "total_applications": total,
-                "submitted": submitted,
-                "reviewed": reviewed,
-                "accepted": accepted,
-                "rejected": rejected
+                "total_applications": sum(counts.values()),
+                "submitted": counts.get("submitted", 0),
+                "reviewed": counts.get("reviewed", 0),
+                "accepted": counts.get("accepted", 0),
+                "rejected": counts.get("rejected", 0)
             }
-            
-        finally:
-            session.close()
     
+    def _search_fts(self, session: Session, search_term: str) -> List["Application"]:
+        # Phrase-prefix query; escape embedded double quotes for FTS5
+        match_query = '"' + search_term.replace('"', '""') + '"*'
+        ids = session.execute(
+            text("SELECT rowid FROM applications_fts WHERE applications_fts MATCH :q LIMIT 50"),
+            {"q": match_query}
+        ).scalars().all()
+
+        if not ids:
+            return []
+
+        return session.query(Application).filter(Application.id.in_(ids)).all()
+
     def search_applications(self, search_term: str) -> List[Dict[str, Any]]:
-        session = self.get_session()
-        try:
-            applications = session.query(Application).filter(
-                (Application.candidate_name.contains(search_term)) |
-                (Application.candidate_email.contains(search_term)) |
-                (Application.job_title.contains(search_term)) |
-                (Application.company.contains(search_term))
-            ).limit(50).all()
+        with self._session() as session:
+            if self._fts_enabled:
+                applications = self._search_fts(session, search_term)
+            else:
+                applications = session.execute(_SEARCH_STMT, {"q": search_term}).scalars().all()
             
             results = []
             for app in applications:
@@ -299,10 +487,9 @@ class DatabaseManager:
                     "status": app.status,
                     "submitted_at": app.submitted_at.isoformat()
                 })
-            
+
             return results
-            
-        finally:
-            session.close()
 
-db_manager = DatabaseManager()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    return DatabaseManager()
\ No newline at end of file
@@ -1,12 +1,17 @@
 import json
 import os
 import hashlib
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import numpy as np
 
+import faiss
+
 from langchain.embeddings import HuggingFaceEmbeddings
 from langchain.vectorstores import FAISS
+from langchain.docstore.in_memory import InMemoryDocstore
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 from langchain_groq import ChatGroq
@@ -15,8 +20,134 @@ from langchain.memory import ConversationBufferMemory
 from langchain.prompts import PromptTemplate
 from dotenv import load_dotenv
 
+# Rayon-threaded fast tokenizers during batched encodes
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+try:
+    import torch
+    # Containers often default PyTorch to one thread; inference never
+    # needs the autograd tape either
+    torch.set_num_threads(os.cpu_count() or 4)
+    torch.set_num_interop_threads(2)
+    torch.set_grad_enabled(False)
+except (ImportError, RuntimeError):
+    # torch absent (pure-ONNX deployment) or thread pools already started
+    pass
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+try:
+    from blake3 import blake3 as _new_hash
+except ImportError:
+    try:
+        from xxhash import xxh3_64 as _new_hash
+    except ImportError:
+        _new_hash = hashlib.md5
+
 load_dotenv()
 
+_EXP_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+_EXP_PLUS_RE = re.compile(r'(\d+)\s*\+')
+_JOB_ID_RE = re.compile(r'JOB\d{3}')
+
+_APPLY_KEYWORDS = ('apply', 'interested', 'select')
+
+try:
+    import ahocorasick
+    # One DFA pass over the message instead of N substring searches
+    _APPLY_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _APPLY_KEYWORDS:
+        _APPLY_AUTOMATON.add_word(_keyword, _keyword)
+    _APPLY_AUTOMATON.make_automaton()
+except ImportError:
+    _APPLY_AUTOMATON = None
+
+def _has_apply_intent(message_lower: str) -> bool:
+    if _APPLY_AUTOMATON is not None:
+        return next(_APPLY_AUTOMATON.iter(message_lower), None) is not None
+    return any(keyword in message_lower for keyword in _APPLY_KEYWORDS)
+
+def _parse_salary_min(salary_range: str) -> int:
+    try:
+        return int(salary_range.split('-')[0].replace(' LPA', '').strip())
+    except (ValueError, IndexError):
+        return -1
+
+def _parse_experience_range(text: str) -> tuple:
+    match = _EXP_RANGE_RE.search(text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+
+    match = _EXP_PLUS_RE.search(text)
+    if match:
+        return int(match.group(1)), 99
+
+    return 0, 99
+
+class ONNXMiniLMEmbeddings:
+    # MiniLM served through ONNX Runtime with dynamic int8 quantization;
+    # 2-3x faster than vanilla PyTorch on CPU for the query-embedding path
+    MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+    EXPORT_DIR = "onnx_minilm"
+
+    def __init__(self):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        quantized_path = os.path.join(self.EXPORT_DIR, "model_quantized.onnx")
+        if not os.path.exists(quantized_path):
+            model = ORTModelForFeatureExtraction.from_pretrained(self.MODEL_NAME, export=True)
+            model.save_pretrained(self.EXPORT_DIR)
+            quantizer = ORTQuantizer.from_pretrained(self.EXPORT_DIR)
+            quantizer.quantize(
+                save_dir=self.EXPORT_DIR,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False)
+            )
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            self.EXPORT_DIR, file_name="model_quantized.onnx"
+        )
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        inputs = self.tokenizer(texts, padding=True, truncation=True, max_length=256, return_tensors="np")
+        hidden = np.asarray(self.model(**inputs).last_hidden_state)
+        mask = inputs["attention_mask"][:, :, None]
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        # Unit-normalized so cosine similarity reduces to inner product
+        return pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-9, None)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        batches = [
+            self._encode(list(texts[start:start + 64]))
+            for start in range(0, len(texts), 64)
+        ]
+        return np.vstack(batches).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._encode([text])[0].tolist()
+
+def _build_embeddings():
+    try:
+        return ONNXMiniLMEmbeddings()
+    except Exception:
+        # optimum/onnxruntime not installed (or export failed); use PyTorch
+        return HuggingFaceEmbeddings(
+            model_name="sentence-transformers/all-MiniLM-L6-v2",
+            encode_kwargs={"normalize_embeddings": True}
+        )
+
 @dataclass
 class JobSearchResult:
     job_id: str
@@ -33,22 +164,104 @@ class RAGEngine:
     def __init__(self, jobs_file_path: str = "data/jobs.json"):
         self.jobs_file_path = jobs_file_path
         self.jobs_data = self._load_jobs()
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2"
-        )
+        self.embeddings = _build_embeddings()
         self.vector_store = None
-        self.conversation_memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            return_messages=True,
-            output_key="answer"
-        )
-        self.llm = self._initialize_llm()
+        # LLM client and chat memory are only needed on the conversational
+        # path, so defer them until first use
+        self._llm = None
+        self._conversation_memory = None
         self._initialize_vector_store()
-        
+
+    @property
+    def llm(self):
+        if self._llm is None:
+            self._llm = self._initialize_llm()
+        return self._llm
+
+    @property
+    def conversation_memory(self):
+        if self._conversation_memory is None:
+            self._conversation_memory = ConversationBufferMemory(
+                memory_key="chat_history",
+                return_messages=True,
+                output_key="answer"
+            )
+        return self._conversation_memory
+
     def _load_jobs(self) -> List[Dict]:
-        with open(self.jobs_file_path, 'r') as f:
-            data = json.load(f)
-        return data['jobs']
+        with open(self.jobs_file_path, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        jobs = data['jobs']
+        for job in jobs:
+            # Parse "3-5 years" / "5+ years" once so filtering is integer math
+            job['exp_min'], job['exp_max'] = _parse_experience_range(job.get('experience_required', ''))
+        self._jobs_by_id = {job['job_id']: job for job in jobs}
+        self._build_filter_arrays(jobs)
+        return jobs
+
+    def _build_filter_arrays(self, jobs: List[Dict]):
+        # Struct-of-arrays layout: filters become one vectorized mask
+        # instead of per-hit dict probing
+        self._loc_lower = np.array([job['location'].lower() for job in jobs])
+        self._sal_min = np.array([_parse_salary_min(job.get('salary_range', '')) for job in jobs], dtype=np.int32)
+        self._exp_lo = np.array([job['exp_min'] for job in jobs], dtype=np.int32)
+        self._exp_hi = np.array([job['exp_max'] for job in jobs], dtype=np.int32)
+        self._id_to_row = {job['job_id']: i for i, job in enumerate(jobs)}
+
+        # Columnar Arrow copy of the same data: its compute kernels run
+        # SIMD-vectorized filter scans when pyarrow is installed
+        if pa is not None:
+            self._filter_tbl = pa.table({
+                'loc_lower': pa.array(self._loc_lower.tolist()),
+                'sal_min': pa.array(self._sal_min, type=pa.int32()),
+                'exp_lo': pa.array(self._exp_lo, type=pa.int32()),
+                'exp_hi': pa.array(self._exp_hi, type=pa.int32()),
+            })
+        else:
+            self._filter_tbl = None
+
+    def _filter_mask_arrow(self, rows: np.ndarray, filters: Dict) -> np.ndarray:
+        tbl = self._filter_tbl.take(pa.array(rows))
+        mask = pa.array(np.ones(len(rows), dtype=bool))
+
+        if 'location' in filters:
+            mask = pc.and_(mask, pc.match_substring(tbl['loc_lower'], filters['location'].lower()))
+
+        if 'min_salary' in filters:
+            sal_min = tbl['sal_min']
+            mask = pc.and_(mask, pc.or_(
+                pc.less(sal_min, 0),
+                pc.greater_equal(sal_min, filters['min_salary'])
+            ))
+
+        if 'experience' in filters:
+            req_lo, req_hi = _parse_experience_range(filters['experience'])
+            mask = pc.and_(mask, pc.and_(
+                pc.greater_equal(tbl['exp_hi'], req_lo),
+                pc.less_equal(tbl['exp_lo'], req_hi)
+            ))
+
+        return mask.to_numpy(zero_copy_only=False)
+
+    def _filter_mask(self, rows: np.ndarray, filters: Dict) -> np.ndarray:
+        if self._filter_tbl is not None:
+            return self._filter_mask_arrow(rows, filters)
+
+        mask = np.ones(len(rows), dtype=bool)
+
+        if 'location' in filters:
+            mask &= np.char.find(self._loc_lower[rows], filters['location'].lower()) >= 0
+
+        if 'min_salary' in filters:
+            sal_min = self._sal_min[rows]
+            # -1 marks an unparseable range; keep those rather than hide the job
+            mask &= (sal_min < 0) | (sal_min >= filters['min_salary'])
+
+        if 'experience' in filters:
+            req_lo, req_hi = _parse_experience_range(filters['experience'])
+            mask &= (self._exp_hi[rows] >= req_lo) & (self._exp_lo[rows] <= req_hi)
+
+        return mask
     
     def _initialize_llm(self):
         from langchain_groq import ChatGroq
@@ -58,83 +271,177 @@ class RAGEngine:
             groq_api_key=os.getenv("GROQ_API_KEY")
         )
     
+    _CONTENT_FIELDS = [
+        ('job_id', 'Job ID'),
+        ('title', 'Title'),
+        ('company', 'Company'),
+        ('location', 'Location'),
+        ('experience_required', 'Experience Required'),
+        ('salary_range', 'Salary Range'),
+        ('skills_required', 'Skills'),
+        ('description', 'Description'),
+        ('responsibilities', 'Responsibilities'),
+        ('qualifications', 'Qualifications'),
+    ]
+
+    def _compile_document_builder(self):
+        # Generate a straight-line builder for this schema once and exec it;
+        # each job then becomes a Document via one specialized f-string with
+        # no per-field dispatch, skipping fields absent from the data
+        sample = self.jobs_data[0] if self.jobs_data else {}
+
+        lines = []
+        for key, label in self._CONTENT_FIELDS:
+            if key not in sample:
+                continue
+            if isinstance(sample[key], list):
+                joiner = ', ' if key == 'skills_required' else '. '
+                lines.append(f"            {label}: {{{joiner!r}.join(job[{key!r}])}}")
+            else:
+                lines.append(f"            {label}: {{job[{key!r}]}}")
+
+        source = (
+            "def _build_document(job):\n"
+            "    return Document(\n"
+            '        page_content=f"""\n'
+            + "\n".join(lines) + "\n"
+            '            """,\n'
+            "        metadata={\n"
+            "            'job_id': job['job_id'],\n"
+            "            'title': job['title'],\n"
+            "            'company': job['company'],\n"
+            "            'location': job['location'],\n"
+            "            'salary_range': job['salary_range'],\n"
+            "            'experience_required': job['experience_required'],\n"
+            "            'exp_min': job['exp_min'],\n"
+            "            'exp_max': job['exp_max'],\n"
+            "            'skills': job['skills_required'],\n"
+            "            'description': job['description']\n"
+            "        }\n"
+            "    )\n"
+        )
+
+        namespace = {"Document": Document}
+        exec(source, namespace)
+        return namespace["_build_document"]
+
     def _create_job_documents(self) -> List[Document]:
-        documents = []
-        
-        for job in self.jobs_data:
-            content = f"""
-            Job ID: {job['job_id']}
-            Title: {job['title']}
-            Company: {job['company']}
-            Location: {job['location']}
-            Experience Required: {job['experience_required']}
-            Salary Range: {job['salary_range']}
-            Skills: {', '.join(job['skills_required'])}
-            Description: {job['description']}
-            Responsibilities: {'. '.join(job['responsibilities'])}
-            Qualifications: {'. '.join(job['qualifications'])}
-            """
-            
-            doc = Document(
-                page_content=content,
-                metadata={
-                    "job_id": job['job_id'],
-                    "title": job['title'],
-                    "company": job['company'],
-                    "location": job['location'],
-                    "salary_range": job['salary_range'],
-                    "experience_required": job['experience_required'],
-                    "skills": json.dumps(job['skills_required']),
-                    "description": job['description'] 
-                }
-            )
-            documents.append(doc)
-            
-        return documents
+        build_document = self._compile_document_builder()
+        return list(map(build_document, self.jobs_data))
     
     def _get_jobs_hash(self) -> str:
+        hasher = _new_hash()
         with open(self.jobs_file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
-    
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _jobs_file_stat(self) -> tuple:
+        stat = os.stat(self.jobs_file_path)
+        return stat.st_mtime_ns, stat.st_size
+
     def _check_index_validity(self) -> bool:
         index_path = "faiss_index"
         hash_file = os.path.join(index_path, ".jobs_hash")
-        
+
         if not os.path.exists(index_path) or not os.path.exists(hash_file):
             return False
-        
+
         try:
             with open(hash_file, 'r') as f:
-                saved_hash = f.read().strip()
-            current_hash = self._get_jobs_hash()
-            return saved_hash == current_hash
+                saved = f.read().strip().split(":")
+            if len(saved) != 3:
+                return False
+
+            saved_hash, saved_mtime_ns, saved_size = saved
+            mtime_ns, size = self._jobs_file_stat()
+
+            # Same mtime and size means the file didn't change; skip rehashing
+            if saved_mtime_ns == str(mtime_ns) and saved_size == str(size):
+                return True
+
+            return saved_hash == self._get_jobs_hash()
         except Exception:
             return False
-    
+
     def _save_jobs_hash(self):
         index_path = "faiss_index"
         hash_file = os.path.join(index_path, ".jobs_hash")
-        
+
+        mtime_ns, size = self._jobs_file_stat()
         os.makedirs(index_path, exist_ok=True)
         with open(hash_file, 'w') as f:
-            f.write(self._get_jobs_hash())
+            f.write(f"{self._get_jobs_hash()}:{mtime_ns}:{size}")
     
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        model = getattr(self.embeddings, "client", None)
+        if model is None:
+            return np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+
+        # One big batched encode; sorting by length keeps padding per batch
+        # minimal, the order is restored via the inverse permutation
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        encoded = model.encode(
+            [texts[i] for i in order],
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
+        embedding_matrix = np.empty_like(encoded)
+        embedding_matrix[order] = encoded
+        return embedding_matrix
+
+    def _save_manifest(self, index_path: str, docs: List[Document], embedding_matrix: np.ndarray):
+        np.save(os.path.join(index_path, "embs.npy"), embedding_matrix)
+        manifest = [{"page_content": doc.page_content, "metadata": doc.metadata} for doc in docs]
+        with open(os.path.join(index_path, "meta.json"), "w") as f:
+            json.dump(manifest, f)
+
+    def _load_vector_store(self, index_path: str) -> Optional[FAISS]:
+        meta_file = os.path.join(index_path, "meta.json")
+        try:
+            if os.path.exists(meta_file):
+                # Native faiss read plus JSON docstore: no pickle on the load
+                # path, and the embedding matrix comes back as a cheap mmap
+                index = faiss.read_index(os.path.join(index_path, "index.faiss"))
+                with open(meta_file, "r") as f:
+                    manifest = json.load(f)
+
+                docs = {
+                    str(i): Document(page_content=entry["page_content"], metadata=entry["metadata"])
+                    for i, entry in enumerate(manifest)
+                }
+                self._embedding_matrix = np.load(os.path.join(index_path, "embs.npy"), mmap_mode="r")
+
+                return FAISS(
+                    embedding_function=self.embeddings,
+                    index=index,
+                    docstore=InMemoryDocstore(docs),
+                    index_to_docstore_id={i: str(i) for i in range(len(manifest))}
+                )
+
+            # Indexes saved before the manifest existed
+            return FAISS.load_local(
+                index_path,
+                self.embeddings,
+                allow_dangerous_deserialization=True
+            )
+        except Exception as e:
+            print(f"Error loading index: {e}. Creating new index...")
+            return None
+
     def _initialize_vector_store(self):
         index_path = "faiss_index"
-        
+
         # Check if index exists and is valid (jobs.json hasn't changed)
         if self._check_index_validity():
-            try:
-                # Load existing index
-                self.vector_store = FAISS.load_local(
-                    index_path, 
-                    self.embeddings,
-                    allow_dangerous_deserialization=True
-                )
+            vector_store = self._load_vector_store(index_path)
+            if vector_store is not None:
+                self.vector_store = vector_store
                 print("✓ Loaded existing FAISS index (jobs.json unchanged)")
                 return
-            except Exception as e:
-                print(f"Error loading index: {e}. Creating new index...")
         else:
             if os.path.exists(index_path):
                 print("⚠ Jobs data changed, recreating index...")
@@ -148,72 +455,97 @@ class RAGEngine:
             chunk_overlap=50
         )
         split_docs = text_splitter.split_documents(documents)
-        self.vector_store = FAISS.from_documents(split_docs, self.embeddings)
-        
-        # Save index and hash for future use
+
+        texts = [doc.page_content for doc in split_docs]
+        embedding_matrix = self._encode_texts(texts).astype(np.float32)
+
+        # HNSW gives sub-linear graph search instead of the brute-force
+        # IndexFlatL2 scan LangChain builds by default; int8 scalar
+        # quantization cuts vector storage 4x with SIMD-friendly distances.
+        # Vectors are unit-normalized, so inner product == cosine and the
+        # distance kernel is a plain dot product
+        index = faiss.IndexHNSWSQ(
+            embedding_matrix.shape[1],
+            faiss.ScalarQuantizer.QT_8bit,
+            32,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        index.hnsw.efConstruction = 200
+        index.hnsw.efSearch = 64
+        index.train(embedding_matrix)
+        index.add(embedding_matrix)
+
+        self.vector_store = FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=InMemoryDocstore({str(i): doc for i, doc in enumerate(split_docs)}),
+            index_to_docstore_id={i: str(i) for i in range(len(split_docs))}
+        )
+        self._embedding_matrix = embedding_matrix
+
+        # Save index, sidecar manifest and hash for future use
         self.vector_store.save_local(index_path)
+        self._save_manifest(index_path, split_docs, embedding_matrix)
         self._save_jobs_hash()
         print("✓ FAISS index created and saved successfully")
     
     def search_jobs(
-        self, 
-        query: str, 
+        self,
+        query: str,
         k: int = 5,
         filters: Optional[Dict] = None
     ) -> List[JobSearchResult]:
-        
-        results = self.vector_store.similarity_search_with_score(query, k=k)
-        
-        job_results = []
-        seen_jobs = set()
-        
+
+        # Higher scores win on IP indexes, lower on legacy L2 ones loaded
+        # from an old on-disk index
+        higher_is_better = self.vector_store.index.metric_type == faiss.METRIC_INNER_PRODUCT
+
+        # The splitter produces several chunks per job, so always over-fetch
+        # and keep only the best-scoring chunk of each job; filtered-out and
+        # duplicate hits then still leave k unique results
+        results = self.vector_store.similarity_search_with_score(query, k=k * 5)
+
+        best_hits = {}
         for doc, score in results:
             job_id = doc.metadata.get('job_id')
-            
-            if job_id and job_id not in seen_jobs:
-                seen_jobs.add(job_id)
-                
-                result = JobSearchResult(
-                    job_id=job_id,
-                    title=doc.metadata.get('title', ''),
-                    company=doc.metadata.get('company', ''),
-                    location=doc.metadata.get('location', ''),
-                    salary_range=doc.metadata.get('salary_range', ''),
-                    experience_required=doc.metadata.get('experience_required', ''),
-                    match_score=float(1 / (1 + score)),
-                    description=doc.metadata.get('description', ''),
-                    skills_required=json.loads(doc.metadata.get('skills', '[]'))
-                )
-                
-                if filters:
-                    if 'location' in filters and filters['location'].lower() not in result.location.lower():
-                        continue
-                    if 'min_salary' in filters:
-                        try:
-                            salary_min = int(result.salary_range.split('-')[0].replace(' LPA', ''))
-                            if salary_min < filters['min_salary']:
-                                continue
-                        except:
-                            pass
-                    if 'experience' in filters:
-                        exp_filter = filters['experience']
-                        job_exp = result.experience_required.lower()
-                    
-                    # Simple keyword matching - you can make this smarter
-                        if exp_filter == "0-2 years" and "0-2" not in job_exp and "0-1" not in job_exp and "1-2" not in job_exp:
-                            continue
-                        elif exp_filter == "2-4 years" and "2-4" not in job_exp and "2-3" not in job_exp and "3-4" not in job_exp:
-                            continue
-                
-                job_results.append(result)
-        
-        return job_results[:k]
+            if not job_id or job_id not in self._id_to_row:
+                continue
+
+            current = best_hits.get(job_id)
+            if current is None or (score > current[1] if higher_is_better else score < current[1]):
+                best_hits[job_id] = (doc, score)
+
+        hits = [(job_id, doc, score) for job_id, (doc, score) in best_hits.items()]
+        hits.sort(key=lambda hit: hit[2], reverse=higher_is_better)
+
+        if filters and hits:
+            rows = np.array([self._id_to_row[job_id] for job_id, _, _ in hits])
+            mask = self._filter_mask(rows, filters)
+            hits = [hit for hit, keep in zip(hits, mask) if keep]
+
+        job_results = []
+        for job_id, doc, score in hits[:k]:
+            skills = doc.metadata.get('skills', [])
+            if isinstance(skills, str):
+                # Indexes built before skills were stored as a plain list
+                skills = json.loads(skills)
+
+            job_results.append(JobSearchResult(
+                job_id=job_id,
+                title=doc.metadata.get('title', ''),
+                company=doc.metadata.get('company', ''),
+                location=doc.metadata.get('location', ''),
+                salary_range=doc.metadata.get('salary_range', ''),
+                experience_required=doc.metadata.get('experience_required', ''),
+                match_score=float((score + 1) / 2) if higher_is_better else float(1 / (1 + score)),
+                description=doc.metadata.get('description', ''),
+                skills_required=skills
+            ))
+
+        return job_results
     
     def get_job_by_id(self, job_id: str) -> Optional[Dict]:
-        for job in self.jobs_data:
-            if job['job_id'] == job_id:
-                return job
-        return None
+        return self._jobs_by_id.get(job_id)
     
     def generate_conversational_response(self, user_input: str) -> Dict[str, Any]:
         prompt_template = """You are JobMatch AI, a helpful assistant for job seekers. 
@@ -283,7 +615,14 @@ class RAGEngine:
         return []
     
     def reset_conversation(self):
-        self.conversation_memory.clear()
+        if self._conversation_memory is not None:
+            self._conversation_memory.clear()
+
+@lru_cache(maxsize=1)
+def get_rag_engine(jobs_file_path: str = "data/jobs.json") -> "RAGEngine":
+    # Process-wide singleton: the embedding model, FAISS index and LLM
+    # client are far too heavy to rebuild per session
+    return RAGEngine(jobs_file_path)
 
 class JobApplicationSession:
     def __init__(self, rag_engine: RAGEngine):
@@ -293,13 +632,15 @@ class JobApplicationSession:
         self.candidate_info = {}
         self.screening_answers = []
         self.current_question_index = 0
-    
+        self._job = None
+        self._questions = []
+
     def process_message(self, message: str) -> Dict[str, Any]:
         
         if self.state == "searching":
             response = self.rag_engine.generate_conversational_response(message)
             
-            if any(keyword in message.lower() for keyword in ['apply', 'interested', 'select']):
+            if _has_apply_intent(message.lower()):
                 job_ids = self._extract_job_id(message)
                 if job_ids:
                     self.selected_job = job_ids[0]
@@ -325,14 +666,19 @@ class JobApplicationSession:
             return self._handle_screening_questions(message)
     
     def _extract_job_id(self, message: str) -> List[str]:
-        import re
-        pattern = r'JOB\d{3}'
-        return re.findall(pattern, message.upper())
+        # Only the first match is ever used, so stop scanning at one
+        match = _JOB_ID_RE.search(message.upper())
+        return [match.group(0)] if match else []
     
     def _handle_application_state(self, message: str) -> Dict[str, Any]:
         self.state = "answering"
-        questions = self.rag_engine.get_screening_questions(self.selected_job)
-        
+
+        # Cache the job and its questions for the rest of the flow so each
+        # answer doesn't re-run the lookup
+        self._job = self.rag_engine.get_job_by_id(self.selected_job)
+        self._questions = (self._job or {}).get('screening_questions', [])
+        questions = self._questions
+
         if questions:
             return {
                 "state": "answering",
@@ -345,8 +691,8 @@ class JobApplicationSession:
             return self._submit_application()
     
     def _handle_screening_questions(self, answer: str) -> Dict[str, Any]:
-        questions = self.rag_engine.get_screening_questions(self.selected_job)
-        
+        questions = self._questions
+
         self.screening_answers.append({
             "question": questions[self.current_question_index]['question'],
             "answer": answer
@@ -385,4 +731,6 @@ class JobApplicationSession:
         self.candidate_info = {}
         self.screening_answers = []
         self.current_question_index = 0
+        self._job = None
+        self._questions = []
         self.rag_engine.reset_conversation()
\ No newline at end of file